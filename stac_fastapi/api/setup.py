@@ -18,6 +18,7 @@ install_requires = [
     "attrs",
     "pydantic[dotenv]",
     "stac_pydantic==1.3.8",
+    "orjson",
 ]
 
 extra_reqs = {
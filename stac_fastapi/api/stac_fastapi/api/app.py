@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional, Type
 import attr
 from fastapi import APIRouter, FastAPI
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
 from stac_pydantic import Collection, Item, ItemCollection
 from stac_pydantic.api import ConformanceClasses, LandingPage
 
@@ -50,7 +51,7 @@ class StacApi:
             Defines a global mapping between exceptions and status codes, allowing configuration of response behavior on
             certain exceptions (https://fastapi.tiangolo.com/tutorial/handling-errors/#install-custom-exception-handlers).
         app:
-            The FastAPI application, defaults to a fresh application.
+            The FastAPI application, defaults to a fresh application which renders responses with orjson.
     """
 
     settings: ApiSettings = attr.ib()
@@ -59,7 +60,9 @@ class StacApi:
     exceptions: Dict[Type[Exception], int] = attr.ib(
         default=attr.Factory(lambda: DEFAULT_STATUS_CODES)
     )
-    app: FastAPI = attr.ib(default=attr.Factory(FastAPI))
+    app: FastAPI = attr.ib(
+        default=attr.Factory(lambda: FastAPI(default_response_class=ORJSONResponse))
+    )
 
     def get_extension(self, extension: Type[ApiExtension]) -> Optional[ApiExtension]:
         """Get an extension.
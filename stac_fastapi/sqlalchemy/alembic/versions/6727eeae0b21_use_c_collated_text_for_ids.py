@@ -0,0 +1,54 @@
+"""use C collated text rather than varchar for ids
+
+Revision ID: 6727eeae0b21
+Revises: c61f5948f025
+Create Date: 2026-10-14 10:12:05.377921
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6727eeae0b21"
+down_revision = "c61f5948f025"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """upgrade to this revision"""
+    op.execute(
+        """
+        ALTER TABLE
+            data.items
+            ALTER COLUMN id
+            TYPE text COLLATE "C",
+            ALTER COLUMN collection_id
+            TYPE text COLLATE "C"
+        ;
+        ALTER TABLE
+            data.collections
+            ALTER COLUMN id
+            TYPE text COLLATE "C"
+        ;
+    """
+    )
+
+
+def downgrade():
+    """downgrade from this revision"""
+    op.execute(
+        """
+        ALTER TABLE
+            data.items
+            ALTER COLUMN id
+            TYPE varchar(1024) COLLATE "default",
+            ALTER COLUMN collection_id
+            TYPE varchar(1024) COLLATE "default"
+        ;
+        ALTER TABLE
+            data.collections
+            ALTER COLUMN id
+            TYPE varchar(1024) COLLATE "default"
+        ;
+    """
+    )
@@ -0,0 +1,57 @@
+"""index item properties
+
+Revision ID: 6f0031f6de77
+Revises: 77c019af60bf
+Create Date: 2026-10-14 09:52:11.204187
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6f0031f6de77"
+down_revision = "77c019af60bf"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """upgrade to this revision"""
+    # Casting a jsonb null raises on postgres < 13, items stored before
+    # ``exclude_none`` exports carry explicit nulls for unset fields
+    op.execute(
+        """
+        UPDATE data.items
+            SET properties = properties - 'gsd'
+            WHERE properties -> 'gsd' = 'null'::jsonb
+        ;
+    """
+    )
+    op.execute(
+        """
+        UPDATE data.items
+            SET properties = properties - 'proj:epsg'
+            WHERE properties -> 'proj:epsg' = 'null'::jsonb
+        ;
+    """
+    )
+    # Range queries (query extension), expressions must match `Item.get_field`
+    op.execute(
+        """
+        CREATE INDEX ix_items_properties_gsd
+            ON data.items (CAST(properties -> 'gsd' AS FLOAT))
+        ;
+    """
+    )
+    op.execute(
+        """
+        CREATE INDEX ix_items_properties_epsg
+            ON data.items (CAST(properties -> 'proj:epsg' AS INTEGER))
+        ;
+    """
+    )
+
+
+def downgrade():
+    """downgrade from this revision"""
+    op.execute("DROP INDEX data.ix_items_properties_epsg")
+    op.execute("DROP INDEX data.ix_items_properties_gsd")
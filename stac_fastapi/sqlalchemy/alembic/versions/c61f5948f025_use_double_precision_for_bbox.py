@@ -0,0 +1,40 @@
+"""use double precision rather than numeric for bbox
+
+Revision ID: c61f5948f025
+Revises: 6f0031f6de77
+Create Date: 2026-10-14 10:03:47.918342
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c61f5948f025"
+down_revision = "6f0031f6de77"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """upgrade to this revision"""
+    op.execute(
+        """
+        ALTER TABLE
+            data.items
+            ALTER COLUMN bbox
+            TYPE double precision[]
+        ;
+    """
+    )
+
+
+def downgrade():
+    """downgrade from this revision"""
+    op.execute(
+        """
+        ALTER TABLE
+            data.items
+            ALTER COLUMN bbox
+            TYPE numeric[]
+        ;
+    """
+    )
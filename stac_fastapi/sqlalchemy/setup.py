@@ -28,6 +28,7 @@ install_requires = [
     "psycopg2-binary",
     "alembic",
     "fastapi-utils",
+    "orjson",
 ]
 
 extra_reqs = {
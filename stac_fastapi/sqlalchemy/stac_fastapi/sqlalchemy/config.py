@@ -1,9 +1,17 @@
 """Postgres API configuration."""
-from typing import Set
+from functools import lru_cache
+from typing import FrozenSet, Tuple
 
 from stac_fastapi.types.config import ApiSettings
 
 
+@lru_cache()
+def _indexed_columns(indexed_fields: FrozenSet[str]) -> Tuple[Tuple[str, str], ...]:
+    """Map indexed item properties to their database column."""
+    # Strip extension namespaces (ex. ``proj:epsg`` -> ``epsg``)
+    return tuple((field, field.split(":")[-1]) for field in indexed_fields)
+
+
 class SqlalchemySettings(ApiSettings):
     """Postgres-specific API settings.
 
@@ -24,10 +32,15 @@ class SqlalchemySettings(ApiSettings):
     postgres_dbname: str
 
     # Fields which are defined by STAC but not included in the database model
-    forbidden_fields: Set[str] = {"type"}
+    forbidden_fields: FrozenSet[str] = frozenset({"type"})
 
     # Fields which are item properties but indexed as distinct fields in the database model
-    indexed_fields: Set[str] = {"datetime"}
+    indexed_fields: FrozenSet[str] = frozenset({"datetime"})
+
+    @property
+    def indexed_columns(self) -> Tuple[Tuple[str, str], ...]:
+        """Pairs of (item property, database column) for each indexed field."""
+        return _indexed_columns(frozenset(self.indexed_fields))
 
     @property
     def reader_connection_string(self):
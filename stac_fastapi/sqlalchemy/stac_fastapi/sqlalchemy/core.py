@@ -1,5 +1,4 @@
 """Item crud client."""
-import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Type, Union
@@ -7,9 +6,8 @@ from urllib.parse import urlencode, urljoin
 
 import attr
 import geoalchemy2 as ga
+import orjson
 import sqlalchemy as sa
-from shapely.geometry import Polygon as ShapelyPolygon
-from shapely.geometry import shape
 from sqlakeyset import get_page
 from sqlalchemy import func
 from sqlalchemy.orm import Session as SqlSession
@@ -214,7 +212,7 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
             "bbox": bbox,
             "limit": limit,
             "token": token,
-            "query": json.loads(query) if query else query,
+            "query": orjson.loads(query) if query else query,
         }
         if datetime:
             base_args["datetime"] = datetime
@@ -320,15 +318,21 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
                 )
 
             else:
-                # Spatial query
-                poly = None
+                # Spatial query, the filter geometry is built by PostGIS
+                filter_geom = None
                 if search_request.intersects is not None:
-                    poly = shape(search_request.intersects)
+                    filter_geom = func.ST_SetSRID(
+                        func.ST_GeomFromGeoJSON(
+                            orjson.dumps(
+                                search_request.intersects.dict(exclude_none=True)
+                            ).decode()
+                        ),
+                        4326,
+                    )
                 elif search_request.bbox:
-                    poly = ShapelyPolygon.from_bounds(*search_request.bbox)
+                    filter_geom = func.ST_MakeEnvelope(*search_request.bbox, 4326)
 
-                if poly:
-                    filter_geom = ga.shape.from_shape(poly, srid=4326)
+                if filter_geom is not None:
                     query = query.filter(
                         ga.func.ST_Intersects(self.item_table.geometry, filter_geom)
                     )
@@ -404,18 +408,19 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
             filter_kwargs = {}
             if self.extension_is_enabled(FieldsExtension):
                 if search_request.query is not None:
-                    query_include: Set[str] = set(
-                        [
-                            k
-                            if k in Settings.get().indexed_fields
-                            else f"properties.{k}"
-                            for k in search_request.query.keys()
-                        ]
-                    )
+                    indexed_fields = Settings.get().indexed_fields
+                    query_include: Set[str] = set()
+                    for queryable in search_request.query:
+                        field_name = queryable.value
+                        query_include.add(
+                            field_name
+                            if field_name in indexed_fields
+                            else f"properties.{field_name}"
+                        )
                     if not search_request.field.include:
                         search_request.field.include = query_include
                     else:
-                        search_request.field.include.union(query_include)
+                        search_request.field.include |= query_include
 
                 filter_kwargs = search_request.field.filter_fields
 
@@ -1,15 +1,18 @@
-"""SQLAlchemy ORM models."""
+"""SQLAlchemy ORM models.
+
+JSONB columns are (de)serialized with orjson by the engine (see ``stac_fastapi.sqlalchemy.session``).
+"""
 
-import json
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional
 
 import geoalchemy2 as ga
+import orjson
 import sqlalchemy as sa
-from shapely.geometry import shape
+from sqlalchemy import func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
-from stac_pydantic.shared import DATETIME_RFC339
 
 from stac_fastapi.sqlalchemy.models import schemas
 from stac_fastapi.types.config import Settings
@@ -18,22 +21,29 @@ from stac_fastapi.types.search import QueryableTypes
 BaseModel = declarative_base()
 
 
+def _utcnow() -> str:
+    """Format the current time as an RFC 3339 timestamp (``DATETIME_RFC339``)."""
+    return datetime.utcnow().isoformat(timespec="seconds") + "Z"
+
+
 class GeojsonGeometry(ga.Geometry):
     """Custom geoalchemy type which returns GeoJSON."""
 
     from_text = "ST_GeomFromGeoJSON"
 
+    def column_expression(self, col):
+        """Override default column expression to have PostGIS encode GeoJSON.
+
+        15 decimal digits are requested so coordinates survive the round trip unchanged.
+        """
+        return func.ST_AsGeoJSON(col, 15, type_=self)
+
     def result_processor(self, dialect: str, coltype):
-        """Override default processer to return GeoJSON."""
+        """Override default processer to decode the GeoJSON text with orjson."""
 
-        def process(value: Optional[bytes]):
+        def process(value: Optional[str]):
             if value is not None:
-                geom = ga.shape.to_shape(
-                    ga.elements.WKBElement(
-                        value, srid=self.srid, extended=self.extended
-                    )
-                )
-                return json.loads(json.dumps(geom.__geo_interface__))
+                return orjson.loads(value)
 
         return process
 
@@ -44,7 +54,7 @@ class Collection(BaseModel):  # type:ignore
     __tablename__ = "collections"
     __table_args__ = {"schema": "data"}
 
-    id = sa.Column(sa.VARCHAR(1024), nullable=False, primary_key=True)
+    id = sa.Column(sa.Text(collation="C"), nullable=False, primary_key=True)
     stac_version = sa.Column(sa.VARCHAR(300))
     stac_extensions = sa.Column(sa.ARRAY(sa.VARCHAR(300)), nullable=True)
     title = sa.Column(sa.VARCHAR(1024))
@@ -52,11 +62,14 @@ class Collection(BaseModel):  # type:ignore
     keywords = sa.Column(sa.VARCHAR(300))
     version = sa.Column(sa.VARCHAR(300))
     license = sa.Column(sa.VARCHAR(300), nullable=False)
-    providers = sa.Column(JSONB)
-    summaries = sa.Column(JSONB, nullable=True)
-    extent = sa.Column(JSONB)
-    links = sa.Column(JSONB)
-    children = sa.orm.relationship("Item", lazy="dynamic")
+    providers = sa.Column(JSONB(none_as_null=True))
+    summaries = sa.Column(JSONB(none_as_null=True), nullable=True)
+    extent = sa.Column(JSONB(none_as_null=True))
+    links = sa.Column(JSONB(none_as_null=True))
+    # Relationships are never loaded implicitly (avoids N+1 queries), use an explicit loader option
+    children = sa.orm.relationship(
+        "Item", back_populates="parent_collection", lazy="raise"
+    )
 
     @classmethod
     def get_database_model(cls, schema: schemas.Collection) -> dict:
@@ -75,60 +88,76 @@ class Item(BaseModel):  # type:ignore
     __tablename__ = "items"
     __table_args__ = {"schema": "data"}
 
-    id = sa.Column(sa.VARCHAR(1024), nullable=False, primary_key=True)
+    id = sa.Column(sa.Text(collation="C"), nullable=False, primary_key=True)
     stac_version = sa.Column(sa.VARCHAR(300))
     stac_extensions = sa.Column(sa.ARRAY(sa.VARCHAR(300)), nullable=True)
     geometry = sa.Column(GeojsonGeometry("POLYGON", srid=4326, spatial_index=True))
-    bbox = sa.Column(sa.ARRAY(sa.NUMERIC), nullable=False)
-    properties = sa.Column(JSONB)
-    assets = sa.Column(JSONB)
+    bbox = sa.Column(sa.ARRAY(sa.Float(precision=53)), nullable=False)
+    properties = sa.Column(JSONB(none_as_null=True))
+    assets = sa.Column(JSONB(none_as_null=True))
     collection_id = sa.Column(
-        sa.VARCHAR(1024), sa.ForeignKey(Collection.id), nullable=False
+        sa.Text(collation="C"), sa.ForeignKey(Collection.id), nullable=False
+    )
+    parent_collection = sa.orm.relationship(
+        "Collection", back_populates="children", lazy="raise"
     )
-    parent_collection = sa.orm.relationship("Collection", back_populates="children")
     datetime = sa.Column(sa.TIMESTAMP(timezone=True), nullable=False)
-    links = sa.Column(JSONB)
+    links = sa.Column(JSONB(none_as_null=True))
 
     @classmethod
-    def get_database_model(cls, schema: schemas.Item) -> dict:
-        """Decompose pydantic model to data model."""
+    def get_database_model(
+        cls, schema: schemas.Item, now: Optional[str] = None
+    ) -> dict:
+        """Decompose pydantic model to data model.
+
+        ``now`` is the RFC 3339 timestamp used for ``created``/``updated``, it defaults to the current time.
+        """
+        settings = Settings.get()
+        # Export the model once and split it into columns
+        data = schema.dict(exclude_none=True, exclude=settings.forbidden_fields)
+        geometry = data.pop("geometry")
+        collection_id = data.pop("collection", None)
+        properties = data.pop("properties")
+
         indexed_fields = {}
-        for field in Settings.get().indexed_fields:
-            # Use getattr to accommodate extension namespaces
-            field_value = getattr(schema.properties, field)
+        for field, column in settings.indexed_columns:
+            # Exclude indexed fields from the properties jsonb field
+            field_value = properties.pop(field, None)
             if field == "datetime":
-                field_value = datetime.strptime(field_value, DATETIME_RFC339)
-            indexed_fields[field.split(":")[-1]] = field_value
+                # ``fromisoformat`` is much faster than ``strptime`` but only accepts ``Z`` from python 3.11
+                field_value = datetime.fromisoformat(field_value.replace("Z", "+00:00"))
+            indexed_fields[column] = field_value
 
-        # Exclude indexed fields from the properties jsonb field
-        properties = schema.properties.dict(exclude=set(Settings.get().indexed_fields))
-        now = datetime.utcnow().strftime(DATETIME_RFC339)
-        if not properties["created"]:
+        now = now or _utcnow()
+        if not properties.get("created"):
             properties["created"] = now
         properties["updated"] = now
 
         return dict(
-            collection_id=schema.collection,
-            geometry=ga.shape.from_shape(shape(schema.geometry), 4326),
+            collection_id=collection_id,
+            # Bound as GeoJSON, see ``GeojsonGeometry.from_text``
+            geometry=orjson.dumps(geometry).decode(),
             properties=properties,
             **indexed_fields,
-            **schema.dict(
-                exclude_none=True,
-                exclude=set(
-                    Settings().get().forbidden_fields
-                    | {"geometry", "properties", "collection"}
-                ),
-            )
+            **data,
         )
 
+    @classmethod
+    def get_database_models(cls, items: Iterable[schemas.Item]) -> List[dict]:
+        """Decompose pydantic models to rows suitable for a bulk ``INSERT`` with sqlalchemy core."""
+        # Items of a batch share the same created/updated timestamp
+        now = _utcnow()
+        return [cls.get_database_model(item, now=now) for item in items]
+
     @classmethod
     def from_schema(cls, schema: schemas.Item) -> "Item":
         """Create orm model from pydantic model."""
         return cls(**cls.get_database_model(schema))
 
     @classmethod
+    @lru_cache()
     def get_field(cls, field_name):
-        """Get a model field."""
+        """Get a model field (cached, the JSONB cast expressions are reusable across queries)."""
         try:
             return getattr(cls, field_name)
         except AttributeError:
@@ -1,9 +1,10 @@
 """Model serialization."""
-import json
+from datetime import timezone
 from typing import Any, Dict, List, Union
 from urllib.parse import urljoin
 
 import geoalchemy2 as ga
+import orjson
 from pydantic import BaseModel
 from pydantic.utils import GetterDict
 from stac_pydantic.shared import DATETIME_RFC339
@@ -41,9 +42,9 @@ class ItemGetter(GetterDict):
     def decode_geom(geom: Union[ga.elements.WKBElement, str, Dict]) -> Dict:
         """Decode geoalchemy type to geojson."""
         if isinstance(geom, ga.elements.WKBElement):
-            return json.loads(json.dumps(ga.shape.to_shape(geom).__geo_interface__))
+            return ga.shape.to_shape(geom).__geo_interface__
         elif isinstance(geom, str):
-            return json.loads(geom)
+            return orjson.loads(geom)
         elif isinstance(geom, dict):
             return geom
         raise DatabaseError("Received unexpected geometry format from database")
@@ -51,11 +52,14 @@ class ItemGetter(GetterDict):
     def __init__(self, obj: Any):
         """Decompose orm model to pydantic model."""
         properties = obj.properties.copy()
-        for field in Settings.get().indexed_fields:
+        for field, column in Settings.get().indexed_columns:
             # Use getattr to accommodate extension namespaces
-            field_value = getattr(obj, field.split(":")[-1])
+            field_value = getattr(obj, column)
             if field == "datetime":
-                field_value = field_value.strftime(DATETIME_RFC339)
+                # Normalize to UTC, psycopg2 returns timestamptz in the session time zone
+                field_value = field_value.astimezone(timezone.utc).strftime(
+                    DATETIME_RFC339
+                )
             properties[field] = field_value
         # Create inferred links
         item_links = ItemLinks(
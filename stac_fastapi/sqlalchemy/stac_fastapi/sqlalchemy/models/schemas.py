@@ -3,8 +3,9 @@
 from datetime import datetime
 from typing import List, Optional, Union
 
+import orjson
 from geojson_pydantic.geometries import Polygon
-from pydantic import BaseModel
+from pydantic import BaseModel, parse_obj_as
 from stac_pydantic import Collection as CollectionBase
 from stac_pydantic import Item as ItemBase
 from stac_pydantic.api.search import DATETIME_RFC339
@@ -43,6 +44,11 @@ class Item(ItemBase):
         orm_mode = True
         getter_dict = ItemGetter
 
+    @classmethod
+    def parse_many(cls, raw: Union[bytes, str]) -> List["Item"]:
+        """Parse the features of a serialized FeatureCollection in a single validation pass."""
+        return parse_obj_as(List[cls], orjson.loads(raw)["features"])  # type:ignore
+
 
 class Items(BaseModel):
     """Items model."""
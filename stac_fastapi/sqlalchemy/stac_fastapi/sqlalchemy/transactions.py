@@ -1,8 +1,7 @@
 """transactions extension client."""
 
-import json
 import logging
-from typing import Dict, Optional, Type
+from typing import Optional, Type
 
 import attr
 
@@ -114,18 +113,6 @@ class BulkTransactionsClient(BaseBulkTransactionsClient):
         """Create sqlalchemy engine."""
         self.engine = self.session.writer.cached_engine
 
-    @staticmethod
-    def _preprocess_item(item: schemas.Item) -> Dict:
-        """Preprocess items to match data model.
-
-        # TODO: dedup with GetterDict logic (ref #58)
-        """
-        item = item.dict(exclude_none=True)
-        item["geometry"] = json.dumps(item["geometry"])
-        item["collection_id"] = item.pop("collection")
-        item["datetime"] = item["properties"].pop("datetime")
-        return item
-
     def bulk_item_insert(
         self, items: schemas.Items, chunk_size: Optional[int] = None, **kwargs
     ) -> str:
@@ -134,7 +121,7 @@ class BulkTransactionsClient(BaseBulkTransactionsClient):
         https://docs.sqlalchemy.org/en/13/faq/performance.html#i-m-inserting-400-000-rows-with-the-orm-and-it-s-really-slow
         """
         # Use items.items because schemas.Items is a model with an items key
-        processed_items = [self._preprocess_item(item) for item in items.items]
+        processed_items = database.Item.get_database_models(items.items)
         return_msg = f"Successfully added {len(processed_items)} items."
         if chunk_size:
             for chunk in self._chunks(processed_items, chunk_size):
@@ -1,12 +1,14 @@
 import uuid
 from typing import Callable
 
+import orjson
 import pytest
 from stac_pydantic import Collection, Item
 from tests.conftest import MockStarletteRequest
 
 from stac_fastapi.extensions.third_party.bulk_transactions import Items
 from stac_fastapi.sqlalchemy.core import CoreCrudClient
+from stac_fastapi.sqlalchemy.models import schemas
 from stac_fastapi.sqlalchemy.transactions import (
     BulkTransactionsClient,
     TransactionsClient,
@@ -209,3 +211,28 @@ def test_bulk_item_insert_chunked(
 
     for item in items:
         postgres_transactions.delete_item(item["id"], request=MockStarletteRequest)
+
+
+def test_bulk_item_insert_parse_many(
+    postgres_core: CoreCrudClient,
+    postgres_transactions: TransactionsClient,
+    postgres_bulk_transactions: BulkTransactionsClient,
+    load_test_data: Callable,
+):
+    coll = Collection.parse_obj(load_test_data("test_collection.json"))
+    postgres_transactions.create_collection(coll, request=MockStarletteRequest)
+
+    item = load_test_data("test_item.json")
+    features = []
+    for _ in range(10):
+        features.append({**item, "id": str(uuid.uuid4())})
+    raw = orjson.dumps({"type": "FeatureCollection", "features": features})
+
+    items = schemas.Item.parse_many(raw)
+    assert len(items) == 10
+    postgres_bulk_transactions.bulk_item_insert(Items(items=items))
+
+    for feat in features:
+        resp = postgres_core.get_item(feat["id"], request=MockStarletteRequest)
+        assert resp.id == feat["id"]
+        postgres_transactions.delete_item(feat["id"], request=MockStarletteRequest)
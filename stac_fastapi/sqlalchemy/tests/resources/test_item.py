@@ -654,6 +654,28 @@ def test_field_extension_post(app_client, load_test_data):
     }
 
 
+def test_field_extension_query_include(app_client, load_test_data):
+    """Test POST search includes queried fields (fields and query extensions)"""
+    test_item = load_test_data("test_item.json")
+    resp = app_client.post(
+        f"/collections/{test_item['collection']}/items", json=test_item
+    )
+    assert resp.status_code == 200
+
+    body = {
+        "fields": {"include": ["properties.gsd"]},
+        "query": {"proj:epsg": {"eq": test_item["properties"]["proj:epsg"]}},
+    }
+
+    resp = app_client.post("/search", json=body)
+    resp_json = resp.json()
+    assert set(resp_json["features"][0]["properties"]) == {
+        "gsd",
+        "proj:epsg",
+        "datetime",
+    }
+
+
 def test_field_extension_exclude_and_include(app_client, load_test_data):
     """Test POST search including/excluding same field (fields extension)"""
     test_item = load_test_data("test_item.json")
@@ -103,12 +103,9 @@ class FieldsExtension(FieldsBase):
         """
         field_dict = {}
         for field in fields or []:
-            if "." in field:
-                parent, key = field.split(".")
-                if parent not in field_dict:
-                    field_dict[parent] = {key}
-                else:
-                    field_dict[parent].add(key)
+            parent, _, key = field.partition(".")
+            if key:
+                field_dict.setdefault(parent, set()).add(key)
             else:
                 field_dict[field] = ...  # type:ignore
         return field_dict